@@ -22,14 +22,36 @@ ROOT_DIR/
 ├─ data/                 # JSON files
 │   ├─ topology_vertex_map.json
 │   └─ expression_masks.json
+├─ bmt_kernels.pyx       # optional, compile with Cython for faster smoothing
 └─ blendshape_mask_tool.py  # this script
 """
 
 import maya.cmds as cmds
 import maya.api.OpenMaya as om
 import maya.mel as mel
+import hashlib
+import importlib.machinery
+import importlib.util
 import json
 import os
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    from scipy import sparse
+except ImportError:
+    sparse = None  # SciPy isn't bundled with Maya; fall back to pure NumPy
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from PySide2 import QtWidgets, QtCore, QtGui
 from shiboken2 import wrapInstance
@@ -46,48 +68,103 @@ ICON_PAINT = os.path.join(ICON_DIR, "3dPaint.png")
 
 VERTEX_MAP_PATH = os.path.join(DATA_DIR, "topology_vertex_map.json")
 MASK_DATA_PATH  = os.path.join(DATA_DIR, "expression_masks.json")
+ADJ_CACHE_DIR = os.path.join(DATA_DIR, ".adj_cache")
+
+
+def load_kernels():
+    # Optional compiled kernels, built from bmt_kernels.pyx inside ROOT_DIR. Loaded by
+    # file path so Maya's shared sys.path is left untouched.
+    for suffix in importlib.machinery.EXTENSION_SUFFIXES:
+        path = os.path.join(ROOT_DIR, "bmt_kernels" + suffix)
+        if not os.path.exists(path):
+            continue
+        try:
+            spec = importlib.util.spec_from_file_location("bmt_kernels", path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            return module
+        except ImportError as e:
+            cmds.warning(f"Could not load compiled kernels, using Python fallback: {e}")
+    return None
+
+
+bmt_kernels = load_kernels()
 
 # === Global State ===
-MASK_DATA = {}
-VERTEX_GROUPS = {}
-VERTEX_TO_COLOR = {}
+MASK_DATA = None  # None until the background loader has finished
+# Parallel arrays sorted by vertex id: VERTEX_IDS[k] has color VERTEX_COLORS[k] (uint8 RGB)
+VERTEX_IDS = np.empty(0, dtype=np.int32)
+VERTEX_COLORS = np.empty((0, 3), dtype=np.uint8)
+# Dense vertex id -> palette index (-1 if uncolored), and each palette color's group verts
+VERTEX_COLOR_INDEX = np.empty(0, dtype=np.int32)
+COLOR_GROUP_VERTS = []
 last_applied_base_mesh = None
 region_selection_mode = False
 current_region_mesh = None
 blendshape_cycle_index = 0
 paint_index = 0
 
+# (mesh, vertex count, face count) -> smoothing operator
+_ADJ_CACHE = {}
 
-def load_vertex_map(file_path):
-    global VERTEX_GROUPS, VERTEX_TO_COLOR
-    try:
-        with open(file_path, "r") as f:
-            data = json.load(f)
 
-        VERTEX_GROUPS = {
-            tuple(map(int, color.strip("()").split(","))): verts
-            for color, verts in data.get("vertex_groups", {}).items()
-        }
+def load_json(file_path):
+    if orjson is not None:
+        with open(file_path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(file_path, "r") as f:
+        return json.load(f)
 
-        VERTEX_TO_COLOR = {
-            int(vid): tuple(map(int, color.strip("()").split(",")))
-            for vid, color in data.get("vertex_to_color", {}).items()
-        }
 
-    except Exception as e:
-        cmds.warning(f"Could not load topology vertex map: {e}")
-        VERTEX_GROUPS = {}
-        VERTEX_TO_COLOR = {}
+def parse_color(color):
+    return tuple(map(int, color.strip("()").split(",")))
 
 
-def load_base_mask(json_path):
-    global MASK_DATA
-    try:
-        with open(json_path) as f:
-            MASK_DATA = json.load(f)
-    except Exception as e:
-        cmds.warning(f"Error loading mask file: {e}")
-        MASK_DATA = {}
+def read_vertex_map(file_path):
+    # No Maya calls in here: it runs on the background loader thread
+    data = load_json(file_path)
+
+    vertex_groups = {
+        parse_color(color): np.asarray(verts, dtype=np.int32)
+        for color, verts in data.get("vertex_groups", {}).items()
+    }
+
+    vertex_to_color = data.get("vertex_to_color", {})
+    vids = np.fromiter(map(int, vertex_to_color.keys()), dtype=np.int32, count=len(vertex_to_color))
+    # Only a handful of distinct colors: parse each string once, then scatter
+    color_strings, inverse = np.unique(list(vertex_to_color.values()), return_inverse=True)
+    palette = np.array([parse_color(c) for c in color_strings], dtype=np.uint8).reshape(-1, 3)
+    order = np.argsort(vids, kind="stable")
+    palette_index = inverse.reshape(-1)[order].astype(np.int32)
+    vertex_ids = vids[order]
+    vertex_colors = palette[palette_index]
+
+    vertex_color_index = np.full(int(vertex_ids[-1]) + 1 if len(vertex_ids) else 0, -1, dtype=np.int32)
+    vertex_color_index[vertex_ids] = palette_index
+    # Shares the arrays in vertex_groups rather than copying them
+    no_verts = np.empty(0, dtype=np.int32)
+    color_group_verts = [vertex_groups.get(color, no_verts) for color in map(tuple, palette.tolist())]
+    return vertex_ids, vertex_colors, vertex_color_index, color_group_verts
+
+
+def set_loaded_data(vertex_map, mask_data):
+    # Runs on the main thread; either argument may be the exception raised while reading it
+    global VERTEX_IDS, VERTEX_COLORS, VERTEX_COLOR_INDEX, COLOR_GROUP_VERTS, MASK_DATA
+
+    if isinstance(vertex_map, Exception):
+        cmds.warning(f"Could not load topology vertex map: {vertex_map}")
+        vertex_map = (
+            np.empty(0, dtype=np.int32),
+            np.empty((0, 3), dtype=np.uint8),
+            np.empty(0, dtype=np.int32),
+            [],
+        )
+    VERTEX_IDS, VERTEX_COLORS, VERTEX_COLOR_INDEX, COLOR_GROUP_VERTS = vertex_map
+
+    if isinstance(mask_data, Exception):
+        cmds.warning(f"Error loading mask file: {mask_data}")
+        mask_data = {}
+    MASK_DATA = mask_data
 
 
 def get_mask_by_key(mask_key):
@@ -98,17 +175,26 @@ def get_mask_by_key(mask_key):
 
 
 def apply_blendshape_mask(target_mesh, base_mesh, mask):
-    mask = [min(max(m, 0.0), 1.0) for m in mask]  # clamp 0–1
     vert_count = cmds.polyEvaluate(base_mesh, vertex=True)
     if len(mask) != vert_count:
         cmds.warning(f"Mask length ({len(mask)}) doesn't match vertex count ({vert_count}) of base mesh.")
         return
 
-    blend_node = cmds.blendShape(target_mesh, base_mesh, name=f"{base_mesh}")[0]
+    # One copy clamped in place (0–1)
+    mask = np.array(mask, dtype=np.float32)
+    np.clip(mask, 0.0, 1.0, out=mask)
+
+    # Node creation and weights undo as a single step
+    cmds.undoInfo(openChunk=True, chunkName="applyBSMask")
+    try:
+        blend_node = cmds.blendShape(target_mesh, base_mesh, name=f"{base_mesh}")[0]
 
-    for i, weight in enumerate(mask):
-        attr = f"{blend_node}.inputTarget[0].inputTargetGroup[0].targetWeights[{i}]"
-        cmds.setAttr(attr, weight)
+        # Set every target weight in one setAttr on a single resolved range path; values go
+        # through as floats, so there is no per-vertex attribute name or number formatting
+        attr = f"{blend_node}.inputTarget[0].inputTargetGroup[0].targetWeights[0:{vert_count - 1}]"
+        cmds.setAttr(attr, *mask.tolist(), size=vert_count)
+    finally:
+        cmds.undoInfo(closeChunk=True)
 
     cmds.inViewMessage(amg="<hl>Applied blendshape mask</hl>", pos='midCenterTop', fade=True)
 
@@ -119,37 +205,209 @@ def apply_blendshape_mask(target_mesh, base_mesh, mask):
 
 
 def get_vertex_adjacency(mesh):
-    adjacency = {}
-    num_verts = cmds.polyEvaluate(mesh, v=True)
-    
-    for i in range(num_verts):
-        adjacency[i] = set()
-    
-    faces = cmds.polyEvaluate(mesh, f=True)
-    
-    for f in range(faces):
-        verts_in_face = cmds.polyInfo(f"{mesh}.f[{f}]", faceToVertex=True)[0]
-        verts = [int(v) for v in verts_in_face.split(':')[1].split()]
-        for i, vi in enumerate(verts):
-            for vj in verts:
-                if vi != vj:
-                    adjacency[vi].add(vj)
-    
-    adjacency = {k: list(v) for k, v in adjacency.items()}
-    return adjacency
-
-
-def smooth_mask(mask, adjacency, iterations=10, weight=0.5):
-    new_mask = mask[:]
+    sel = om.MSelectionList()
+    sel.add(mesh)
+    mesh_fn = om.MFnMesh(sel.getDagPath(0))
+
+    # One API call for the whole face->vertex table instead of a polyInfo per face
+    counts, face_verts = mesh_fn.getVertices()
+    counts = np.fromiter(counts, dtype=np.int32, count=len(counts))
+    face_verts = np.fromiter(face_verts, dtype=np.int32, count=len(face_verts))
+    num_verts = mesh_fn.numVertices
+
+    # Production heads share one topology, so the adjacency is reused across sessions
+    topology_hash = hashlib.blake2b(
+        np.int64(num_verts).tobytes() + counts.tobytes() + face_verts.tobytes(), digest_size=8
+    ).hexdigest()
+    cache_path = os.path.join(ADJ_CACHE_DIR, f"{topology_hash}.npz")
+    if os.path.exists(cache_path):
+        try:
+            with np.load(cache_path) as cached:
+                return cached["indptr"], cached["indices"]
+        except Exception as e:
+            cmds.warning(f"Could not read adjacency cache, rebuilding: {e}")
+
+    build = bmt_kernels.build_adjacency_csr if bmt_kernels is not None else build_adjacency_csr
+    indptr, indices = build(counts, face_verts, num_verts)
+    try:
+        os.makedirs(ADJ_CACHE_DIR, exist_ok=True)
+        np.savez(cache_path, indptr=indptr, indices=indices)
+    except Exception as e:
+        cmds.warning(f"Could not write adjacency cache: {e}")
+    return indptr, indices
+
+
+def build_adjacency_csr(counts, face_verts, num_verts):
+    # Every pair of vertices sharing a face are neighbors. Each (row, col) pair is packed
+    # into one int64 key in a preallocated buffer, so a single sort + dedupe yields CSR.
+    face_starts = np.zeros(len(counts), dtype=np.int64)
+    np.cumsum(counts[:-1], out=face_starts[1:])
+
+    sizes, faces_per_size = np.unique(counts, return_counts=True)
+    keys = np.empty(int(np.dot(faces_per_size, sizes * (sizes - 1))), dtype=np.int64)
+    offset = 0
+    # Faces are grouped by vertex count so each group expands to its pairs as one gather
+    for size in sizes:
+        faces = face_verts[face_starts[counts == size][:, None] + np.arange(size)].astype(np.int64)
+        # Like itertools.combinations(verts, 2): each unordered pair once, no self pairs;
+        # both directions are then written from the same two gathers
+        i, j = np.triu_indices(size, k=1)
+        a, b = faces[:, i], faces[:, j]
+        group = keys[offset:offset + 2 * a.size].reshape(2, len(faces), len(i))
+        np.multiply(a, num_verts, out=group[0])
+        group[0] += b
+        np.multiply(b, num_verts, out=group[1])
+        group[1] += a
+        offset += group.size
+
+    keys = np.unique(keys)
+    indices = (keys % num_verts).astype(np.int32)
+    indptr = np.searchsorted(keys // num_verts, np.arange(num_verts + 1)).astype(np.int32)
+    return indptr, indices
+
+
+_laplacian_csr = None
+
+
+def _laplacian_csr_py(values, indptr, indices, out):
+    for i in prange(len(indptr) - 1):
+        start, end = indptr[i], indptr[i + 1]
+        if start == end:
+            out[i] = 0.0
+            continue
+        total = 0.0
+        for k in range(start, end):
+            total += values[indices[k]]
+        out[i] = total / (end - start) - values[i]
+
+
+def get_numba_laplacian():
+    # Native fallback when SciPy and bmt_kernels are missing
+    global _laplacian_csr
+    if _laplacian_csr is None:
+        signature = "void(float32[::1], int32[::1], int32[::1], float32[::1])"
+        try:
+            # Reuse the compiled kernel across Maya sessions when run from a file
+            _laplacian_csr = njit(signature, parallel=True, fastmath=True, cache=True)(_laplacian_csr_py)
+        except RuntimeError:
+            # Pasted into the Script Editor there is no file to cache next to
+            _laplacian_csr = njit(signature, parallel=True, fastmath=True)(_laplacian_csr_py)
+    return _laplacian_csr
+
+
+# Warm-compile at load, but only when Numba is the backend build_smooth_operator will pick
+if bmt_kernels is None and sparse is None and njit is not None:
+    get_numba_laplacian()
+
+
+def build_smooth_operator(indptr, indices):
+    # Returns laplacian(x, out): out = mean(x[neighbors]) - x, i.e. (D^-1 A - I) x; zero for isolated vertices
+    num_verts = len(indptr) - 1
+    degree = np.diff(indptr)
+    isolated = degree == 0
+    inv_degree = (1.0 / np.maximum(degree, 1)).astype(np.float32)
+
+    if bmt_kernels is not None:
+        indptr = np.ascontiguousarray(indptr, dtype=np.int32)
+        indices = np.ascontiguousarray(indices, dtype=np.int32)
+
+        def laplacian(values, out):
+            bmt_kernels.laplacian_csr(values, indptr, indices, out)
+
+    elif sparse is not None:
+        data = np.repeat(inv_degree, degree)
+        matrix = sparse.csr_matrix((data, indices, indptr), shape=(num_verts, num_verts))
+
+        # SciPy has no out= for sparse mat-vec, so each call still allocates the product
+        def laplacian(values, out):
+            np.subtract(matrix.dot(values), values, out=out)
+            out[isolated] = 0.0
+
+    elif njit is not None:
+        indptr = np.ascontiguousarray(indptr, dtype=np.int32)
+        indices = np.ascontiguousarray(indices, dtype=np.int32)
+        kernel = get_numba_laplacian()
+
+        def laplacian(values, out):
+            kernel(values, indptr, indices, out)
+
+    else:
+        # reduceat can't express empty rows, so only reduce over vertices that have neighbors
+        connected = ~isolated
+        starts = indptr[:-1][connected]
+        connected_inv_degree = inv_degree[connected]
+
+        def laplacian(values, out):
+            out.fill(0.0)
+            if len(starts):
+                out[connected] = np.add.reduceat(values[indices], starts) * connected_inv_degree - values[connected]
+
+    return laplacian
+
+
+def get_smooth_operator(mesh):
+    # Topology doesn't change between region applies on the same head, so build once.
+    # Vertex/face counts are a cheap fingerprint in case the mesh gets replaced.
+    key = (mesh, cmds.polyEvaluate(mesh, v=True), cmds.polyEvaluate(mesh, f=True))
+    operator = _ADJ_CACHE.get(key)
+    if operator is None:
+        operator = _ADJ_CACHE[key] = build_smooth_operator(*get_vertex_adjacency(mesh))
+    return operator
+
+
+def apply_smooth_operator(mask, laplacian, iterations=5, lam=0.5, mu=-0.53):
+    # Taubin smoothing: a shrinking lambda step followed by an inflating mu step,
+    # so the mask blurs without its regions collapsing like plain Laplacian smoothing
+    new_mask = np.array(mask, dtype=np.float32)
+    delta = np.empty_like(new_mask)  # reused by every step instead of allocating per iteration
     for _ in range(iterations):
-        temp_mask = new_mask[:]
-        for i, neighbors in adjacency.items():
-            neighbor_sum = sum(new_mask[j] * weight for j in neighbors)
-            temp_mask[i] = (new_mask[i] + neighbor_sum) / (1 + weight * len(neighbors))
-        new_mask = temp_mask
+        for factor in (lam, mu):
+            laplacian(new_mask, delta)
+            delta *= factor
+            new_mask += delta
     return new_mask
 
 
+def get_selected_vertex_ids():
+    # Read vertex indices straight from the API instead of parsing "mesh.vtx[i]" strings
+    ids = []
+    sel_iter = om.MItSelectionList(om.MGlobal.getActiveSelectionList(), om.MFn.kMeshVertComponent)
+    while not sel_iter.isDone():
+        _, component = sel_iter.getComponent()
+        ids.extend(om.MFnSingleIndexedComponent(component).getElements())
+        sel_iter.next()
+    return np.array(ids, dtype=np.int32)
+
+
+@lru_cache(maxsize=None)
+def get_icon(icon_path):
+    return QtGui.QIcon(icon_path)
+
+
+class DataLoaderSignals(QtCore.QObject):
+    loaded = QtCore.Signal(object, object)
+
+
+class DataLoader(QtCore.QRunnable):
+    # Parses the JSON data off the UI thread and hands the results back through a signal
+    def __init__(self, vertex_map_path, mask_data_path):
+        super(DataLoader, self).__init__()
+        self.vertex_map_path = vertex_map_path
+        self.mask_data_path = mask_data_path
+        self.signals = DataLoaderSignals()
+
+    def run(self):
+        try:
+            vertex_map = read_vertex_map(self.vertex_map_path)
+        except Exception as e:
+            vertex_map = e
+        try:
+            mask_data = load_json(self.mask_data_path)
+        except Exception as e:
+            mask_data = e
+        self.signals.loaded.emit(vertex_map, mask_data)
+
+
 def get_maya_main_window():
     ptr = omui.MQtUtil.mainWindow()
     return wrapInstance(int(ptr), QtWidgets.QWidget)
@@ -173,24 +431,67 @@ class BlendMaskTool(QtWidgets.QDialog):
         self.spin_box.setRange(1, 30)      
         self.spin_box.setSingleStep(1)    # step size when clicking arrows
         # self.spin_box.setDecimals(1)    # number of decimal places to display
-        self.spin_box.setValue(10)        # default value
+        self.spin_box.setValue(5)         # default value
                         
         self.smooth_label = QtWidgets.QLabel("Smooth iters:")
         self.smooth_label.hide()
         self.spin_box.hide()
 
+        # Taubin inflate factor; must be slightly larger in magnitude than lambda (0.5).
+        # Above -0.5 it only shrinks again, and much below it amplifies over many iterations.
+        self.mu_spin_box = QtWidgets.QDoubleSpinBox()
+        self.mu_spin_box.setRange(-0.7, -0.51)
+        self.mu_spin_box.setSingleStep(0.01)
+        self.mu_spin_box.setDecimals(2)
+        self.mu_spin_box.setValue(-0.53)
+
+        self.mu_label = QtWidgets.QLabel("mu:")
+        self.mu_label.hide()
+        self.mu_spin_box.hide()
+
         self.create_with_number_btn = QtWidgets.QPushButton("Create Region Mesh (with number)")
 
         self.isolate_btn = QtWidgets.QPushButton("Isolate Base Mesh")
         self.paint_btn = QtWidgets.QPushButton("Toggle BS Paint Tool")
         self.shape_btn = QtWidgets.QPushButton("Shape Editor")
 
+        # SelectionChanged callback, registered only while the dialog is visible
+        self._selection_cb_id = None
+
         self._build_ui()
         self._connect_signals()
 
-        # Load data
-        load_vertex_map(VERTEX_MAP_PATH)
-        load_base_mask(MASK_DATA_PATH)
+        # Load data in the background; kept referenced so the signals object outlives run()
+        self._loader = DataLoader(VERTEX_MAP_PATH, MASK_DATA_PATH)
+        self._loader.setAutoDelete(False)
+        self._loader.signals.loaded.connect(self.on_data_loaded)
+        QtCore.QThreadPool.globalInstance().start(self._loader)
+
+    def on_data_loaded(self, vertex_map, mask_data):
+        set_loaded_data(vertex_map, mask_data)
+        self._loader = None
+
+    def showEvent(self, event):
+        # Icons are only decoded once the window is actually shown
+        self.isolate_btn.setIcon(get_icon(ICON_ISOLATE))
+        self.paint_btn.setIcon(get_icon(ICON_PAINT))
+        self.shape_btn.setIcon(get_icon(ICON_SHAPE_EDITOR))
+
+        # Selection watcher: only runs when Maya's selection actually changes
+        if self._selection_cb_id is None:
+            self._selection_cb_id = om.MEventMessage.addEventCallback(
+                "SelectionChanged", lambda *_: self.on_selection_changed()
+            )
+        # The callback only fires on the next change, so pick up the current selection now
+        self.on_selection_changed()
+        super(BlendMaskTool, self).showEvent(event)
+
+    def hideEvent(self, event):
+        # Covers close, Esc (reject/done) and hide alike
+        if self._selection_cb_id is not None:
+            om.MMessage.removeCallback(self._selection_cb_id)
+            self._selection_cb_id = None
+        super(BlendMaskTool, self).hideEvent(event)
 
     def _build_ui(self):
         layout = QtWidgets.QVBoxLayout(self)
@@ -205,21 +506,22 @@ class BlendMaskTool(QtWidgets.QDialog):
         spin_layout = QtWidgets.QHBoxLayout()
         spin_layout.addWidget(self.smooth_label)
         spin_layout.addWidget(self.spin_box)
+        spin_layout.addWidget(self.mu_label)
+        spin_layout.addWidget(self.mu_spin_box)
         spin_layout.addWidget(self.region_btn)
         layout.addLayout(spin_layout)
 
         btn_layout = QtWidgets.QHBoxLayout()
-        self._setup_icon_button(self.isolate_btn, ICON_ISOLATE)
-        self._setup_icon_button(self.paint_btn, ICON_PAINT)
-        self._setup_icon_button(self.shape_btn, ICON_SHAPE_EDITOR)
+        self._setup_icon_button(self.isolate_btn)
+        self._setup_icon_button(self.paint_btn)
+        self._setup_icon_button(self.shape_btn)
 
         btn_layout.addWidget(self.isolate_btn)
         btn_layout.addWidget(self.paint_btn)
         btn_layout.addWidget(self.shape_btn)
         layout.addLayout(btn_layout)
 
-    def _setup_icon_button(self, button, icon_path):
-        button.setIcon(QtGui.QIcon(icon_path))
+    def _setup_icon_button(self, button):
         button.setIconSize(QtCore.QSize(40, 40))
         button.setMinimumHeight(60)
 
@@ -230,11 +532,6 @@ class BlendMaskTool(QtWidgets.QDialog):
         self.paint_btn.clicked.connect(self.toggle_blendshape_paint_tool)
         self.shape_btn.clicked.connect(lambda: cmds.ShapeEditor())
 
-        # Selection watcher
-        self.selection_timer = QtCore.QTimer()
-        self.selection_timer.timeout.connect(self.on_selection_changed)
-        self.selection_timer.start(500)  # 0.5 sec polling
-
     def on_selection_changed(self):
         if region_selection_mode:
             return  # Ignore updates while in region selection mode
@@ -257,6 +554,10 @@ class BlendMaskTool(QtWidgets.QDialog):
             self.base_field.setText(sel_objects[1])
 
     def apply_mask_from_ui(self):
+        if MASK_DATA is None:
+            cmds.warning("Data still loading.")
+            return
+
         target_mesh = self.target_field.text()
         base_mesh = self.base_field.text()
         mask_key = base_mesh.replace('_head_lod0_meshhead_grp', '')
@@ -273,6 +574,10 @@ class BlendMaskTool(QtWidgets.QDialog):
     def toggle_region_selection(self):
         global region_selection_mode, current_region_mesh
 
+        if MASK_DATA is None:
+            cmds.warning("Data still loading.")
+            return
+
         if not region_selection_mode:
             sel_mesh = self.create_region_selection_mesh()
             if not sel_mesh:
@@ -291,6 +596,8 @@ class BlendMaskTool(QtWidgets.QDialog):
 
             self.smooth_label.show()
             self.spin_box.show()
+            self.mu_label.show()
+            self.mu_spin_box.show()
 
             cmds.inViewMessage(
                 amg="<hl>Select vertices, then click again to apply region mask.</hl>",
@@ -315,6 +622,8 @@ class BlendMaskTool(QtWidgets.QDialog):
             self.region_btn.setText("Create Region Selection Mesh")
             self.smooth_label.hide()
             self.spin_box.hide()
+            self.mu_label.hide()
+            self.mu_spin_box.hide()
 
     def create_region_selection_mesh(self):
         base_mesh = self.base_field.text()
@@ -330,11 +639,12 @@ class BlendMaskTool(QtWidgets.QDialog):
         dag_path = sel_dag.getDagPath(0)
         mesh_fn = om.MFnMesh(dag_path)
 
-        vertex_indices = list(VERTEX_TO_COLOR.keys())
-        colors = [
-            om.MColor((r / 255.0, g / 255.0, b / 255.0, 1.0))
-            for r, g, b in VERTEX_TO_COLOR.values()
-        ]
+        # Build the RGBA buffer in NumPy and hand it over as plain tuples, so no
+        # MColor wrapper objects are constructed one vertex at a time
+        rgba = np.ones((len(VERTEX_COLORS), 4), dtype=np.float32)
+        rgba[:, :3] = VERTEX_COLORS / np.float32(255.0)
+        colors = om.MColorArray(list(map(tuple, rgba.tolist())))
+        vertex_indices = om.MIntArray(VERTEX_IDS.tolist())
         mesh_fn.setVertexColors(colors, vertex_indices)
         cmds.setAttr(f"{sel_mesh}.displayColors", 1)
 
@@ -350,17 +660,17 @@ class BlendMaskTool(QtWidgets.QDialog):
 
     def apply_region_mask_from_selection(self):
         iters = self.spin_box.value()
-        sel_vertices = cmds.ls(selection=True, flatten=True)
-        if not sel_vertices:
+        mu = self.mu_spin_box.value()
+        selected_ids = get_selected_vertex_ids()
+        if not len(selected_ids):
             cmds.warning("Please select vertices.")
             return
 
-        selected_ids = [int(v.split("[")[-1].split("]")[0]) for v in sel_vertices if "[" in v]
-        region_group_verts = set()
-        for vid in selected_ids:
-            if vid in VERTEX_TO_COLOR:
-                color = VERTEX_TO_COLOR[vid]
-                region_group_verts.update(VERTEX_GROUPS.get(color, []))
+        selected_ids = selected_ids[(selected_ids >= 0) & (selected_ids < len(VERTEX_COLOR_INDEX))]
+        color_ids = np.unique(VERTEX_COLOR_INDEX[selected_ids])
+        region_group_verts = np.unique(np.concatenate(
+            [COLOR_GROUP_VERTS[c] for c in color_ids if c >= 0] or [np.empty(0, dtype=np.int32)]
+        ))
 
         target_mesh = self.target_field.text()
         base_mesh = self.base_field.text()
@@ -378,9 +688,10 @@ class BlendMaskTool(QtWidgets.QDialog):
         if base_mask is None:
             return
         
-        adjacency = get_vertex_adjacency(base_mesh)
-        final_mask = [1 if i in region_group_verts else bm for i, bm in enumerate(base_mask)]
-        mask = smooth_mask(final_mask, adjacency, iterations=iters)
+        operator = get_smooth_operator(base_mesh)
+        final_mask = np.array(base_mask, dtype=np.float32)
+        final_mask[region_group_verts[region_group_verts < len(final_mask)]] = 1.0
+        mask = apply_smooth_operator(final_mask, operator, iterations=iters, mu=mu)
 
         apply_blendshape_mask(target_mesh, base_mesh, mask)
 
@@ -0,0 +1,89 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Optional compiled kernels for blendshape_mask_tool.py.
+
+Build inside ROOT_DIR with Maya's Python (mayapy) so the ABI matches:
+    mayapy -m Cython.Build.Cythonize -i bmt_kernels.pyx
+If the compiled module isn't found, the tool falls back to SciPy / Numba / NumPy.
+"""
+
+import numpy as np
+from libc.stdlib cimport qsort
+
+
+cdef int _cmp_int(const void* a, const void* b) noexcept nogil:
+    cdef int x = (<const int*>a)[0]
+    cdef int y = (<const int*>b)[0]
+    return (x > y) - (x < y)
+
+
+def laplacian_csr(const float[::1] values, const int[::1] indptr, const int[::1] indices, float[::1] out):
+    # out[i] = mean(values[neighbors]) - values[i]; zero for isolated vertices
+    cdef Py_ssize_t i, k
+    cdef Py_ssize_t num_verts = indptr.shape[0] - 1
+    cdef int start, end
+    cdef double total
+
+    with nogil:
+        for i in range(num_verts):
+            start = indptr[i]
+            end = indptr[i + 1]
+            if start == end:
+                out[i] = 0.0
+                continue
+            total = 0.0
+            for k in range(start, end):
+                total += values[indices[k]]
+            out[i] = <float>(total / (end - start) - values[i])
+
+
+def build_adjacency_csr(const int[::1] counts, const int[::1] face_verts, int num_verts):
+    # Every pair of vertices sharing a face are neighbors; returns (indptr, indices) as int32
+    cdef Py_ssize_t num_faces = counts.shape[0]
+    cdef Py_ssize_t f, a, b, k, v, start, row_start, row_end, write
+    cdef int vi
+    cdef Py_ssize_t[::1] bound = np.zeros(num_verts + 1, dtype=np.intp)
+    cdef Py_ssize_t[::1] fill
+    cdef int[::1] pairs
+    cdef int[::1] indptr = np.zeros(num_verts + 1, dtype=np.int32)
+
+    # Upper bound on each row's length: every face contributes (k - 1) neighbors per vertex
+    with nogil:
+        start = 0
+        for f in range(num_faces):
+            k = counts[f]
+            for a in range(start, start + k):
+                bound[face_verts[a] + 1] += k - 1
+            start += k
+        for v in range(num_verts):
+            bound[v + 1] += bound[v]
+
+    pairs = np.empty(bound[num_verts], dtype=np.int32)
+    fill = np.array(bound[:num_verts], dtype=np.intp)
+
+    with nogil:
+        start = 0
+        for f in range(num_faces):
+            k = counts[f]
+            for a in range(start, start + k):
+                vi = face_verts[a]
+                for b in range(start, start + k):
+                    if b != a:
+                        pairs[fill[vi]] = face_verts[b]
+                        fill[vi] += 1
+            start += k
+
+        # Sort and dedupe each row, compacting the rows towards the front of the buffer
+        write = 0
+        for v in range(num_verts):
+            row_start = bound[v]
+            row_end = bound[v + 1]
+            if row_end > row_start:
+                qsort(&pairs[row_start], row_end - row_start, sizeof(int), _cmp_int)
+                for a in range(row_start, row_end):
+                    if a == row_start or pairs[a] != pairs[a - 1]:
+                        pairs[write] = pairs[a]
+                        write += 1
+            indptr[v + 1] = <int>write
+
+    return np.asarray(indptr), np.array(pairs[:write])